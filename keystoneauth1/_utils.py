@@ -12,6 +12,7 @@
 
 import datetime
 import logging
+import sys
 
 import iso8601
 import six
@@ -24,6 +25,13 @@ def get_logger(name):
 
 logger = get_logger(__name__)
 
+# datetime.fromisoformat is implemented in C and much faster than iso8601,
+# but it only understands the 'Z' suffix keystone uses from python 3.11.
+if sys.version_info >= (3, 11):
+    _fromisoformat = datetime.datetime.fromisoformat
+else:
+    _fromisoformat = None
+
 
 def normalize_time(timestamp):
     """Normalize time in arbitrary timezone to UTC naive object."""
@@ -35,6 +43,24 @@ def normalize_time(timestamp):
 
 def parse_isotime(timestr):
     """Parse time from ISO 8601 format."""
+    # fromisoformat also accepts formats iso8601 doesn't, like week dates,
+    # so only use it for the YYYY-MM-DDThh:mm... date-times keystone emits.
+    if (_fromisoformat and isinstance(timestr, six.string_types) and
+            len(timestr) > 10 and timestr[4] == '-' and
+            timestr[7] == '-' and timestr[10] in 'T '):
+        try:
+            timestamp = _fromisoformat(timestr)
+        except (TypeError, ValueError):
+            # leave anything unusual to iso8601
+            pass
+        else:
+            offset = timestamp.utcoffset()
+            if offset is None:
+                return timestamp.replace(tzinfo=iso8601.UTC)
+            # iso8601 rejects offsets with seconds, so let it raise for them
+            if not offset.seconds % 60:
+                return timestamp
+
     try:
         return iso8601.parse_date(timestr)
     except iso8601.ParseError as e:
@@ -14,7 +14,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import calendar
 import functools
+import time
+import types
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from positional import positional
 
@@ -26,6 +34,14 @@ from keystoneauth1.access import service_providers
 # gap, in seconds, to determine whether the given token is about to expire
 STALE_TOKEN_DURATION = 30
 
+# shared default for sections missing from a token body. It's shared by
+# every instance so must never be written to; python 2.7 has no read-only
+# mapping type so it's only enforced on python 3.
+try:
+    _EMPTY = types.MappingProxyType({})
+except AttributeError:
+    _EMPTY = {}
+
 
 __all__ = ('AccessInfo',
            'AccessInfoV2',
@@ -33,18 +49,34 @@ __all__ = ('AccessInfo',
            'create')
 
 
+def _json_body(resp):
+    # orjson is considerably faster than the stdlib decoder used by
+    # resp.json(), which shows up on large tokens with a catalog. It is an
+    # optional dependency (the 'orjson' extra) so fall back to requests if
+    # it's not installed. orjson only accepts UTF-8 and doesn't try to
+    # detect the encoding of the response like resp.json() does, so if it
+    # can't decode the body leave it to resp.json(). That also means an
+    # invalid body raises the same exception as it does without orjson.
+    if orjson:
+        try:
+            return orjson.loads(resp.content)
+        except orjson.JSONDecodeError:
+            pass
+
+    return resp.json()
+
+
 @positional()
 def create(resp=None, body=None, auth_token=None):
     if resp and not body:
-        body = resp.json()
+        body = _json_body(resp)
 
-    if 'token' in body:
-        if resp and not auth_token:
-            auth_token = resp.headers.get('X-Subject-Token')
+    for key, access_class in _ACCESS_CLASSES:
+        if key in body:
+            if resp and not auth_token and access_class._token_header:
+                auth_token = resp.headers.get(access_class._token_header)
 
-        return AccessInfoV3(body, auth_token)
-    elif 'access' in body:
-        return AccessInfoV2(body, auth_token)
+            return access_class(body, auth_token)
 
     raise ValueError('Unrecognized auth response')
 
@@ -68,17 +100,37 @@ class AccessInfo(object):
 
     """
 
+    __slots__ = ('__weakref__',
+                 '_data',
+                 '_auth_token',
+                 '_service_catalog',
+                 '_service_providers',
+                 '_expires',
+                 '_expires_epoch',
+                 '_issued',
+                 '_role_names')
+
     _service_catalog_class = None
+    _token_header = None
 
     def __init__(self, body, auth_token=None):
         self._data = body
         self._auth_token = auth_token
         self._service_catalog = None
         self._service_providers = None
+        self._expires = None
+        self._expires_epoch = None
+        self._issued = None
+        self._role_names = None
+
+    def __reduce__(self):
+        # only the raw body is needed to rebuild the object, everything else
+        # is derived from it and doesn't need to be serialized.
+        return self.__class__, (self._data, self._auth_token)
 
     @property
     def service_catalog(self):
-        if not self._service_catalog:
+        if self._service_catalog is None:
             self._service_catalog = self._service_catalog_class.from_token(
                 self._data)
 
@@ -91,11 +143,12 @@ class AccessInfo(object):
         :rtype: boolean
 
         """
-        norm_expires = utils.normalize_time(self.expires)
-        # (gyee) should we move auth_token.will_expire_soon() to timeutils
-        # instead of duplicating code here?
-        soon = utils.from_utcnow(seconds=stale_duration)
-        return norm_expires < soon
+        if self._expires_epoch is None:
+            norm_expires = utils.normalize_time(self.expires)
+            self._expires_epoch = (calendar.timegm(norm_expires.timetuple()) +
+                                   norm_expires.microsecond / 1000000.0)
+
+        return self._expires_epoch < time.time() + stale_duration
 
     def has_service_catalog(self):
         """Return true if the auth token has a service catalog.
@@ -409,32 +462,58 @@ class AccessInfo(object):
 class AccessInfoV2(AccessInfo):
     """An object for encapsulating raw v2 auth token from identity service."""
 
+    __slots__ = ('_access',
+                 '_token',
+                 '_user',
+                 '_trust',
+                 '_has_service_catalog',
+                 '_project_scoped',
+                 '_trust_scoped',
+                 '_audit_id',
+                 '_audit_chain_id')
+
     version = 'v2.0'
     _service_catalog_class = service_catalog.ServiceCatalogV2
 
+    def __init__(self, body, auth_token=None):
+        super(AccessInfoV2, self).__init__(body, auth_token=auth_token)
+
+        self._access = body.get('access', _EMPTY)
+        self._token = self._access.get('token', _EMPTY)
+        self._user = self._access.get('user', _EMPTY)
+        self._trust = self._access.get('trust', _EMPTY)
+        self._has_service_catalog = 'serviceCatalog' in self._access
+        self._trust_scoped = bool(self._trust)
+        self._project_scoped = bool(self.project_id)
+
+        audit_ids = self._token.get('audit_ids') or ()
+        self._audit_id = audit_ids[0] if audit_ids else None
+        self._audit_chain_id = audit_ids[1] if len(audit_ids) > 1 else None
+
     def has_service_catalog(self):
-        return 'serviceCatalog' in self._data.get('access', {})
+        return self._has_service_catalog
 
     @_missingproperty
     def auth_token(self):
         set_token = super(AccessInfoV2, self).auth_token
-        return set_token or self._data['access']['token']['id']
-
-    @property
-    def _token(self):
-        return self._data['access']['token']
+        return set_token or self._token['id']
 
     @_missingproperty
     def expires(self):
-        return utils.parse_isotime(self._token.get('expires'))
+        if self._expires is None:
+            # a missing token section means no expiry, but a token without
+            # an expires value is invalid and fails to parse.
+            self._expires = utils.parse_isotime(
+                self._access['token'].get('expires'))
+
+        return self._expires
 
     @_missingproperty
     def issued(self):
-        return utils.parse_isotime(self._token['issued_at'])
+        if self._issued is None:
+            self._issued = utils.parse_isotime(self._token['issued_at'])
 
-    @property
-    def _user(self):
-        return self._data['access']['user']
+        return self._issued
 
     @_missingproperty
     def username(self):
@@ -454,12 +533,16 @@ class AccessInfoV2(AccessInfo):
 
     @_missingproperty
     def role_ids(self):
-        metadata = self._data.get('access', {}).get('metadata', {})
+        metadata = self._access.get('metadata', _EMPTY)
         return metadata.get('roles', [])
 
     @_missingproperty
     def role_names(self):
-        return [r['name'] for r in self._user.get('roles', [])]
+        if self._role_names is None:
+            self._role_names = tuple(r['name']
+                                     for r in self._user.get('roles', []))
+
+        return list(self._role_names)
 
     @property
     def domain_name(self):
@@ -471,40 +554,35 @@ class AccessInfoV2(AccessInfo):
 
     @property
     def project_name(self):
-        try:
-            tenant_dict = self._token['tenant']
-        except KeyError:
-            pass
-        else:
-            return tenant_dict.get('name')
+        if 'tenant' in self._token:
+            return self._token['tenant'].get('name')
 
         # pre grizzly
-        try:
+        if 'tenantName' in self._user:
             return self._user['tenantName']
-        except KeyError:
-            pass
 
         # pre diablo, keystone only provided a tenantId
-        try:
-            return self._token['tenantId']
-        except KeyError:
-            pass
+        return self._token.get('tenantId')
 
     @property
-    def domain_scoped(self):
-        return False
+    def scoped(self):
+        return self._project_scoped
 
     @property
-    def _trust(self):
-        return self._data['access']['trust']
+    def project_scoped(self):
+        return self._project_scoped
+
+    @property
+    def domain_scoped(self):
+        return False
 
     @_missingproperty
     def trust_id(self):
         return self._trust['id']
 
-    @_missingproperty
+    @property
     def trust_scoped(self):
-        return bool(self._trust)
+        return self._trust_scoped
 
     @_missingproperty
     def trustee_user_id(self):
@@ -517,24 +595,15 @@ class AccessInfoV2(AccessInfo):
 
     @property
     def project_id(self):
-        try:
-            tenant_dict = self._token['tenant']
-        except KeyError:
-            pass
-        else:
-            return tenant_dict.get('id')
+        if 'tenant' in self._token:
+            return self._token['tenant'].get('id')
 
         # pre grizzly
-        try:
+        if 'tenantId' in self._user:
             return self._user['tenantId']
-        except KeyError:
-            pass
 
         # pre diablo
-        try:
-            return self._token['tenantId']
-        except KeyError:
-            pass
+        return self._token.get('tenantId')
 
     @property
     def project_is_domain(self):
@@ -566,17 +635,11 @@ class AccessInfoV2(AccessInfo):
 
     @property
     def audit_id(self):
-        try:
-            return self._token.get('audit_ids', [])[0]
-        except IndexError:
-            return None
+        return self._audit_id
 
     @property
     def audit_chain_id(self):
-        try:
-            return self._token.get('audit_ids', [])[1]
-        except IndexError:
-            return None
+        return self._audit_chain_id
 
     @property
     def service_providers(self):
@@ -590,31 +653,71 @@ class AccessInfoV2(AccessInfo):
 class AccessInfoV3(AccessInfo):
     """An object encapsulating raw v3 auth token from identity service."""
 
+    __slots__ = ('_token',
+                 '_user',
+                 '_domain',
+                 '_project',
+                 '_trust',
+                 '_oauth',
+                 '_has_service_catalog',
+                 '_is_federated',
+                 '_project_scoped',
+                 '_domain_scoped',
+                 '_trust_scoped',
+                 '_audit_id',
+                 '_audit_chain_id',
+                 '_role_ids')
+
     version = 'v3'
     _service_catalog_class = service_catalog.ServiceCatalogV3
+    _token_header = 'X-Subject-Token'
 
-    def has_service_catalog(self):
-        return 'catalog' in self._data['token']
+    def __init__(self, body, auth_token=None):
+        super(AccessInfoV3, self).__init__(body, auth_token=auth_token)
+
+        # v2 role_ids come straight from the token metadata, so only v3
+        # needs to cache them.
+        self._role_ids = None
+        self._token = body.get('token', _EMPTY)
+        self._user = self._token.get('user', _EMPTY)
+        self._domain = self._token.get('domain', _EMPTY)
+        self._project = self._token.get('project', _EMPTY)
+        self._trust = self._token.get('OS-TRUST:trust', _EMPTY)
+        self._oauth = self._token.get('OS-OAUTH1', _EMPTY)
+        self._has_service_catalog = 'catalog' in self._token
+        self._is_federated = 'OS-FEDERATION' in self._user
+        self._domain_scoped = bool(self._domain)
+        self._trust_scoped = bool(self._trust)
+        self._project_scoped = bool(self.project_id)
+
+        audit_ids = self._token.get('audit_ids') or ()
+        self._audit_id = audit_ids[0] if audit_ids else None
+        self._audit_chain_id = audit_ids[1] if len(audit_ids) > 1 else None
 
-    @property
-    def _user(self):
-        return self._data['token']['user']
+    def has_service_catalog(self):
+        return self._has_service_catalog
 
     @property
     def is_federated(self):
-        return 'OS-FEDERATION' in self._user
+        return self._is_federated
 
     @property
     def is_admin_project(self):
-        return self._data.get('token', {}).get('is_admin_project', True)
+        return self._token.get('is_admin_project', True)
 
     @_missingproperty
     def expires(self):
-        return utils.parse_isotime(self._data['token']['expires_at'])
+        if self._expires is None:
+            self._expires = utils.parse_isotime(self._token['expires_at'])
+
+        return self._expires
 
     @_missingproperty
     def issued(self):
-        return utils.parse_isotime(self._data['token']['issued_at'])
+        if self._issued is None:
+            self._issued = utils.parse_isotime(self._token['issued_at'])
+
+        return self._issued
 
     @_missingproperty
     def user_id(self):
@@ -622,38 +725,38 @@ class AccessInfoV3(AccessInfo):
 
     @property
     def user_domain_id(self):
-        try:
-            return self._user['domain']['id']
-        except KeyError:
-            if self.is_federated:
-                return None
-            raise
+        if self._is_federated:
+            return self._user.get('domain', _EMPTY).get('id')
+
+        return self._user['domain']['id']
 
     @property
     def user_domain_name(self):
-        try:
-            return self._user['domain']['name']
-        except KeyError:
-            if self.is_federated:
-                return None
-            raise
+        if self._is_federated:
+            return self._user.get('domain', _EMPTY).get('name')
+
+        return self._user['domain']['name']
 
     @_missingproperty
     def role_ids(self):
-        return [r['id'] for r in self._data['token'].get('roles', [])]
+        if self._role_ids is None:
+            self._role_ids = tuple(r['id']
+                                   for r in self._token.get('roles', []))
+
+        return list(self._role_ids)
 
     @_missingproperty
     def role_names(self):
-        return [r['name'] for r in self._data['token'].get('roles', [])]
+        if self._role_names is None:
+            self._role_names = tuple(r['name']
+                                     for r in self._token.get('roles', []))
+
+        return list(self._role_names)
 
     @_missingproperty
     def username(self):
         return self._user['name']
 
-    @property
-    def _domain(self):
-        return self._data['token']['domain']
-
     @_missingproperty
     def domain_name(self):
         return self._domain['name']
@@ -662,17 +765,13 @@ class AccessInfoV3(AccessInfo):
     def domain_id(self):
         return self._domain['id']
 
-    @property
-    def _project(self):
-        return self._data['token']['project']
-
     @_missingproperty
     def project_id(self):
         return self._project['id']
 
     @_missingproperty
     def project_is_domain(self):
-        return self._data['token']['is_domain']
+        return self._token['is_domain']
 
     @_missingproperty
     def project_domain_id(self):
@@ -687,15 +786,16 @@ class AccessInfoV3(AccessInfo):
         return self._project['name']
 
     @property
-    def domain_scoped(self):
-        try:
-            return bool(self._domain)
-        except KeyError:
-            return False
+    def scoped(self):
+        return self._project_scoped or self._domain_scoped
+
+    @property
+    def project_scoped(self):
+        return self._project_scoped
 
     @property
-    def _trust(self):
-        return self._data['token']['OS-TRUST:trust']
+    def domain_scoped(self):
+        return self._domain_scoped
 
     @_missingproperty
     def trust_id(self):
@@ -703,10 +803,7 @@ class AccessInfoV3(AccessInfo):
 
     @property
     def trust_scoped(self):
-        try:
-            return bool(self._trust)
-        except KeyError:
-            return False
+        return self._trust_scoped
 
     @_missingproperty
     def trustee_user_id(self):
@@ -716,10 +813,6 @@ class AccessInfoV3(AccessInfo):
     def trustor_user_id(self):
         return self._trust['trustor_user']['id']
 
-    @property
-    def _oauth(self):
-        return self._data['token']['OS-OAUTH1']
-
     @_missingproperty
     def oauth_access_token_id(self):
         return self._oauth['access_token_id']
@@ -728,23 +821,17 @@ class AccessInfoV3(AccessInfo):
     def oauth_consumer_id(self):
         return self._oauth['consumer_id']
 
-    @_missingproperty
+    @property
     def audit_id(self):
-        try:
-            return self._data['token']['audit_ids'][0]
-        except IndexError:
-            return None
+        return self._audit_id
 
-    @_missingproperty
+    @property
     def audit_chain_id(self):
-        try:
-            return self._data['token']['audit_ids'][1]
-        except IndexError:
-            return None
+        return self._audit_chain_id
 
     @property
     def service_providers(self):
-        if not self._service_providers:
+        if self._service_providers is None:
             self._service_providers = (
                 service_providers.ServiceProviders.from_token(self._data))
 
@@ -752,4 +839,10 @@ class AccessInfoV3(AccessInfo):
 
     @_missingproperty
     def bind(self):
-        return self._data['token']['bind']
+        return self._token['bind']
+
+
+# top level key of the auth response body for each token format, in the
+# order they are checked by create()
+_ACCESS_CLASSES = (('token', AccessInfoV3),
+                   ('access', AccessInfoV2))
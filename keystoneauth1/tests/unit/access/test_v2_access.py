@@ -11,7 +11,9 @@
 # under the License.
 
 import datetime
+import pickle
 import uuid
+import weakref
 
 from oslo_utils import timeutils
 
@@ -67,6 +69,25 @@ class AccessV2Test(utils.TestCase):
         self.assertTrue(auth_ref.will_expire_soon(stale_duration=300))
         self.assertFalse(auth_ref.will_expire_soon())
 
+    def test_expires_missing(self):
+        token = fixture.V2Token()
+        del token['access']['token']['expires']
+        auth_ref = access.create(body=token)
+        self.assertRaises(ValueError, getattr, auth_ref, 'expires')
+
+        auth_ref = access.AccessInfoV2({'access': {}})
+        self.assertIsNone(auth_ref.expires)
+
+    def test_no_instance_dict(self):
+        auth_ref = access.create(body=fixture.V2Token())
+        self.assertFalse(hasattr(auth_ref, '__dict__'))
+
+    def test_weakref(self):
+        for token in (fixture.V2Token(), fixture.V3Token()):
+            auth_ref = access.create(body=token)
+            self.assertFalse(hasattr(auth_ref, '__dict__'))
+            self.assertIs(auth_ref, weakref.ref(auth_ref)())
+
     def test_building_scoped_accessinfo(self):
         token = fixture.V2Token()
         token.set_scope()
@@ -216,3 +237,18 @@ class AccessV2Test(utils.TestCase):
         auth_ref = access.create(body=token)
         self.assertIsInstance(auth_ref, access.AccessInfoV2)
         self.assertIs(True, auth_ref.is_admin_project)
+
+    def test_pickle(self):
+        token = fixture.V2Token()
+        token.set_scope()
+        auth_ref = access.create(body=token, auth_token=uuid.uuid4().hex)
+        auth_ref.will_expire_soon()
+
+        new_ref = pickle.loads(pickle.dumps(auth_ref))
+
+        self.assertIsInstance(new_ref, type(auth_ref))
+        self.assertEqual(auth_ref.auth_token, new_ref.auth_token)
+        self.assertEqual(auth_ref._data, new_ref._data)
+        self.assertEqual(auth_ref.project_id, new_ref.project_id)
+        self.assertEqual(auth_ref.expires, new_ref.expires)
+        self.assertTrue(new_ref.project_scoped)
@@ -13,9 +13,19 @@
 import uuid
 
 import datetime
+import json
+import operator
+import pickle
+
+import mock
 from oslo_utils import timeutils
+import requests
+import six
+import testtools
 
+from keystoneauth1 import _utils as ksa_utils
 from keystoneauth1 import access
+from keystoneauth1.access import access as access_module
 from keystoneauth1 import fixture
 from keystoneauth1.tests.unit import utils
 
@@ -65,6 +75,59 @@ class AccessV3Test(utils.TestCase):
         self.assertIsNone(token.audit_chain_id)
         self.assertIsNone(auth_ref.bind)
 
+    AUTH_URL = utils.TestCase.TEST_ROOT_URL + 'v3/auth/tokens'
+
+    def _create_from_response(self):
+        token = fixture.V3Token()
+        token_id = uuid.uuid4().hex
+        url = self.AUTH_URL
+        self.requests_mock.post(url,
+                                json=token,
+                                headers={'X-Subject-Token': token_id})
+
+        resp = requests.post(url)
+        auth_ref = access.create(resp=resp)
+
+        self.assertIsInstance(auth_ref, access.AccessInfoV3)
+        self.assertEqual(token_id, auth_ref.auth_token)
+        self.assertEqual(token.user_id, auth_ref.user_id)
+        return resp
+
+    def _create_from_invalid_response(self):
+        self.requests_mock.post(self.AUTH_URL, text='not json')
+        resp = requests.post(self.AUTH_URL)
+
+        with mock.patch.object(requests.Response, 'json',
+                               side_effect=ValueError('invalid')) as m:
+            self.assertRaises(ValueError, access.create, resp=resp)
+
+        self.assertEqual(1, m.call_count)
+
+    def test_create_from_response_with_orjson(self):
+        orjson = mock.Mock(JSONDecodeError=ValueError)
+        orjson.loads.side_effect = lambda data: json.loads(data.decode())
+        with mock.patch.object(access_module, 'orjson', orjson):
+            resp = self._create_from_response()
+            self._create_from_invalid_response()
+
+        orjson.loads.assert_has_calls([mock.call(resp.content),
+                                       mock.call(b'not json')])
+
+    def test_create_from_response_without_orjson(self):
+        with mock.patch.object(access_module, 'orjson', None):
+            self._create_from_response()
+            self._create_from_invalid_response()
+
+    @testtools.skipIf(access_module.orjson is None, 'orjson is not installed')
+    def test_create_from_response_real_orjson(self):
+        with mock.patch.object(access_module.orjson, 'loads',
+                               wraps=access_module.orjson.loads) as m:
+            resp = self._create_from_response()
+            self._create_from_invalid_response()
+
+        m.assert_has_calls([mock.call(resp.content),
+                            mock.call(b'not json')])
+
     def test_will_expire_soon(self):
         expires = timeutils.utcnow() + datetime.timedelta(minutes=5)
         token = fixture.V3Token(expires=expires)
@@ -73,6 +136,54 @@ class AccessV3Test(utils.TestCase):
         self.assertTrue(auth_ref.will_expire_soon(stale_duration=301))
         self.assertFalse(auth_ref.will_expire_soon())
 
+    def test_expires_is_parsed_once(self):
+        token = fixture.V3Token()
+        expires = token.expires
+        auth_ref = access.create(body=token)
+
+        with mock.patch.object(ksa_utils, 'parse_isotime',
+                               wraps=ksa_utils.parse_isotime) as m:
+            self.assertEqual(expires, auth_ref.expires)
+            self.assertEqual(expires, auth_ref.expires)
+            auth_ref.will_expire_soon()
+
+        self.assertEqual(1, m.call_count)
+
+    def test_missing_sections_are_read_only(self):
+        if six.PY2:
+            self.skipTest('read-only mappings require python 3')
+
+        auth_ref = access.AccessInfoV3({'token': {}})
+        self.assertRaises(TypeError,
+                          operator.setitem, auth_ref._user, 'id', 'x')
+
+        other_ref = access.AccessInfoV3({'token': {}})
+        self.assertIsNone(other_ref.user_id)
+
+    def test_role_lists_are_not_shared(self):
+        token = fixture.V3Token()
+        token.add_role(name='admin')
+        token.add_role(name='member')
+        auth_ref = access.create(body=token)
+
+        auth_ref.role_names.remove('admin')
+        auth_ref.role_ids.pop()
+
+        self.assertEqual(token.role_names, auth_ref.role_names)
+        self.assertEqual(token.role_ids, auth_ref.role_ids)
+
+    def test_issued_is_parsed_once(self):
+        token = fixture.V3Token()
+        issued = token.issued
+        auth_ref = access.create(body=token)
+
+        with mock.patch.object(ksa_utils, 'parse_isotime',
+                               wraps=ksa_utils.parse_isotime) as m:
+            self.assertEqual(issued, auth_ref.issued)
+            self.assertEqual(issued, auth_ref.issued)
+
+        self.assertEqual(1, m.call_count)
+
     def test_building_domain_scoped_accessinfo(self):
         token = fixture.V3Token()
         token.set_domain_scope()
@@ -262,3 +373,18 @@ class AccessV3Test(utils.TestCase):
         auth_ref = access.create(body=token)
         self.assertIsInstance(auth_ref, access.AccessInfoV3)
         self.assertIs(False, auth_ref.is_admin_project)
+
+    def test_pickle(self):
+        token = fixture.V3Token()
+        token.set_project_scope()
+        auth_ref = access.create(body=token, auth_token=uuid.uuid4().hex)
+        auth_ref.will_expire_soon()
+
+        new_ref = pickle.loads(pickle.dumps(auth_ref))
+
+        self.assertIsInstance(new_ref, type(auth_ref))
+        self.assertEqual(auth_ref.auth_token, new_ref.auth_token)
+        self.assertEqual(auth_ref._data, new_ref._data)
+        self.assertEqual(auth_ref.project_id, new_ref.project_id)
+        self.assertEqual(auth_ref.expires, new_ref.expires)
+        self.assertTrue(new_ref.project_scoped)
@@ -10,6 +10,9 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import datetime
+
+import iso8601
 import testtools
 
 from keystoneauth1 import _utils
@@ -20,3 +23,33 @@ class UtilsTests(testtools.TestCase):
     def test_get_logger(self):
         self.assertEqual('keystoneauth.tests.unit.test_utils',
                          _utils.get_logger(__name__).name)
+
+    def test_parse_isotime(self):
+        expected = datetime.datetime(2012, 10, 3, 16, 58, 1, 123456,
+                                     tzinfo=iso8601.UTC)
+
+        for timestr in ('2012-10-03T16:58:01.123456Z',
+                        '2012-10-03T16:58:01.123456+00:00',
+                        '2012-10-03T18:58:01.123456+02:00',
+                        '2012-10-03T16:58:01.123456'):
+            self.assertEqual(expected, _utils.parse_isotime(timestr))
+
+    def test_parse_isotime_defaults_to_utc(self):
+        timestamp = _utils.parse_isotime('2012-10-03T16:58:01Z')
+        self.assertEqual(datetime.timedelta(0), timestamp.utcoffset())
+
+        timestamp = _utils.parse_isotime('2012-10-03T16:58:01')
+        self.assertEqual(datetime.timedelta(0), timestamp.utcoffset())
+
+    def test_parse_isotime_invalid(self):
+        self.assertRaises(ValueError, _utils.parse_isotime, 'not a time')
+        self.assertRaises(ValueError, _utils.parse_isotime, None)
+        self.assertRaises(ValueError, _utils.parse_isotime, '2012-W40-3')
+        self.assertRaises(ValueError, _utils.parse_isotime,
+                          '2012-W40-3T16:58:01Z')
+        self.assertRaises(ValueError, _utils.parse_isotime,
+                          '2012-277T16:58:01Z')
+        self.assertRaises(ValueError, _utils.parse_isotime,
+                          '2012-10-03t16:58:01Z')
+        self.assertRaises(ValueError, _utils.parse_isotime,
+                          '2012-10-03T16:58:01+02:00:30')